@@ -6,6 +6,7 @@
 
 use chrono::Utc;
 use serde::{Deserialize, Serialize};
+use std::collections::VecDeque;
 use std::pin::Pin;
 use std::sync::Arc;
 use tokio::sync::{broadcast, RwLock};
@@ -161,7 +162,7 @@ pub enum ErrorType {
 /// Stores normalized log entries and broadcasts them to subscribers.
 #[derive(Debug, Clone)]
 pub struct LogStore {
-    entries: Arc<RwLock<Vec<NormalizedEntry>>>,
+    entries: Arc<RwLock<VecDeque<NormalizedEntry>>>,
     broadcaster: Arc<broadcast::Sender<NormalizedEntry>>,
     capacity: usize,
 }
@@ -176,7 +177,7 @@ impl LogStore {
     pub fn with_capacity(capacity: usize) -> Self {
         let (tx, _) = broadcast::channel(capacity);
         Self {
-            entries: Arc::new(RwLock::new(Vec::with_capacity(capacity))),
+            entries: Arc::new(RwLock::new(VecDeque::with_capacity(capacity))),
             broadcaster: Arc::new(tx),
             capacity,
         }
@@ -184,20 +185,23 @@ impl LogStore {
 
     /// Add an entry to the store
     pub async fn add_entry(&self, entry: NormalizedEntry) {
-        // Store in memory
         let mut entries = self.entries.write().await;
         if entries.len() >= self.capacity {
-            entries.remove(0); // Remove oldest entry
+            entries.pop_front(); // Remove oldest entry
+        }
+
+        // Broadcast to subscribers, skipping the clone when nobody is listening
+        if self.broadcaster.receiver_count() > 0 {
+            let _ = self.broadcaster.send(entry.clone());
         }
-        entries.push(entry.clone());
 
-        // Broadcast to subscribers
-        let _ = self.broadcaster.send(entry);
+        // Store in memory
+        entries.push_back(entry);
     }
 
     /// Get all entries from the store
     pub async fn get_entries(&self) -> Vec<NormalizedEntry> {
-        self.entries.read().await.clone()
+        self.entries.read().await.iter().cloned().collect()
     }
 
     /// Get entries since a specific index
@@ -206,7 +210,7 @@ impl LogStore {
         if index >= entries.len() {
             Vec::new()
         } else {
-            entries[index..].to_vec()
+            entries.range(index..).cloned().collect()
         }
     }
 
@@ -229,14 +233,12 @@ impl LogStore {
     ///
     /// Returns a stream that will receive all new log entries.
     pub fn subscribe(&self) -> LogStream {
-        LogStream {
-            receiver: self.broadcaster.subscribe(),
-        }
+        LogStream::new(self.broadcaster.subscribe())
     }
 
     /// Get a snapshot of current entries + a subscription for future entries
     pub async fn snapshot_and_subscribe_async(&self) -> (Vec<NormalizedEntry>, LogStream) {
-        let entries = self.entries.read().await.clone();
+        let entries = self.entries.read().await.iter().cloned().collect();
         let stream = self.subscribe();
         (entries, stream)
     }
@@ -272,16 +274,36 @@ impl Default for LogStore {
 
 /// Log stream receiver
 ///
-/// A stream of log entries from a LogStore.
-#[derive(Debug)]
+/// A stream of log entries from a LogStore. A subscriber that falls more than
+/// the store's capacity behind skips the entries it missed rather than
+/// ending the stream, so a slow consumer never stalls the producer.
 pub struct LogStream {
-    receiver: broadcast::Receiver<NormalizedEntry>,
+    inner: LogEntryStream,
 }
 
 impl LogStream {
     /// Create a new log stream
     pub fn new(receiver: broadcast::Receiver<NormalizedEntry>) -> Self {
-        Self { receiver }
+        let inner = futures_util::stream::unfold(receiver, |mut receiver| async move {
+            loop {
+                match receiver.recv().await {
+                    Ok(entry) => return Some((entry, receiver)),
+                    // Lagged - the oldest entries were overwritten, resume from the next one
+                    Err(broadcast::error::RecvError::Lagged(_)) => continue,
+                    Err(broadcast::error::RecvError::Closed) => return None,
+                }
+            }
+        });
+
+        Self {
+            inner: Box::pin(inner),
+        }
+    }
+}
+
+impl std::fmt::Debug for LogStream {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("LogStream").finish_non_exhaustive()
     }
 }
 
@@ -292,17 +314,8 @@ impl futures_util::Stream for LogStream {
         mut self: std::pin::Pin<&mut Self>,
         cx: &mut std::task::Context<'_>,
     ) -> std::task::Poll<Option<Self::Item>> {
-        // Use try_recv to avoid blocking
-        match self.receiver.try_recv() {
-            Ok(entry) => std::task::Poll::Ready(Some(entry)),
-            Err(broadcast::error::TryRecvError::Empty) => {
-                // Schedule wakeup
-                cx.waker().wake_by_ref();
-                std::task::Poll::Pending
-            }
-            Err(broadcast::error::TryRecvError::Closed) => std::task::Poll::Ready(None),
-            Err(_) => std::task::Poll::Ready(None), // Lagged - channel overflow
-        }
+        // Waits on the channel rather than re-polling in a loop while idle
+        futures_util::Stream::poll_next(self.inner.as_mut(), cx)
     }
 }
 
@@ -363,6 +376,12 @@ impl JsonLogNormalizer {
 
     /// Parse a JSON log entry
     fn parse_json_entry(&self, json: &str) -> Option<NormalizedEntry> {
+        // Only objects carry structured fields; skip the parser (and the error
+        // it allocates) for plain-text lines
+        if !json.trim_start().starts_with('{') {
+            return None;
+        }
+
         let value: serde_json::Value = serde_json::from_str(json).ok()?;
 
         // Extract common fields
@@ -382,7 +401,7 @@ impl JsonLogNormalizer {
             timestamp: value.get("timestamp").and_then(|v| v.as_str()).map(|s| s.to_string()),
             entry_type,
             content,
-            metadata: Some(value.clone()),
+            metadata: Some(value),
             agent_type: self.agent_type.clone(),
         })
     }
@@ -440,22 +459,20 @@ impl LogNormalizer for JsonLogNormalizer {
             tokio::runtime::Handle::try_current().unwrap().block_on(raw_logs.get_entries())
         });
 
-        // Parse each entry
+        // Parse each entry, moving owned fields instead of cloning them
         let normalized: Vec<NormalizedEntry> = entries
             .into_iter()
-            .filter_map(|entry| {
-                if let Some(parsed) = self.parse_json_entry(&entry.content) {
-                    Some(parsed)
-                } else {
+            .map(|entry| {
+                self.parse_json_entry(&entry.content).unwrap_or_else(|| {
                     // Fall back to plain text
-                    Some(NormalizedEntry {
-                        timestamp: entry.timestamp.clone(),
+                    NormalizedEntry {
+                        timestamp: entry.timestamp,
                         entry_type: EntryType::Output,
-                        content: entry.content.clone(),
+                        content: entry.content,
                         metadata: None,
                         agent_type: self.agent_type.clone(),
-                    })
-                }
+                    }
+                })
             })
             .collect();
 
@@ -517,6 +534,31 @@ mod tests {
         assert_eq!(received.content, "test");
     }
 
+    #[tokio::test]
+    async fn test_log_stream_skips_lagged_entries() {
+        let store = LogStore::with_capacity(2);
+        let mut stream = store.subscribe();
+
+        // Overflow the channel before the subscriber reads anything
+        for i in 0..4 {
+            let entry = NormalizedEntry::new(
+                EntryType::output(),
+                format!("entry {}", i),
+                "test-agent".to_string(),
+            );
+            store.add_entry(entry).await;
+        }
+
+        use tokio::time::{timeout, Duration};
+        let result = timeout(Duration::from_millis(100), async {
+            use futures_util::StreamExt;
+            stream.next().await
+        })
+        .await;
+        let received = result.unwrap().expect("stream should survive lagging");
+        assert_eq!(received.content, "entry 2");
+    }
+
     #[tokio::test]
     async fn test_log_store_capacity() {
         let store = LogStore::with_capacity(3);
@@ -536,6 +578,20 @@ mod tests {
         assert_eq!(entries[0].content, "entry 2"); // First two entries removed
     }
 
+    #[test]
+    fn test_json_normalizer_parse_entry() {
+        let normalizer = JsonLogNormalizer::new("test-agent".to_string());
+
+        let parsed = normalizer
+            .parse_json_entry(r#"{"type": "system", "message": "ready"}"#)
+            .unwrap();
+        assert_eq!(parsed.content, "ready");
+        assert!(matches!(parsed.entry_type, EntryType::System));
+
+        assert!(normalizer.parse_json_entry("plain text output").is_none());
+        assert!(normalizer.parse_json_entry("[1, 2, 3]").is_none());
+    }
+
     #[test]
     fn test_normalized_entry() {
         let entry = NormalizedEntry::new(
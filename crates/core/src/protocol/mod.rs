@@ -7,12 +7,13 @@ pub mod control;
 pub mod messages;
 
 use async_trait::async_trait;
+use bytes::{Buf, BytesMut};
 use futures_util::{Stream, StreamExt};
 use std::sync::Arc;
 use thiserror::Error;
 use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader, WriteHalf};
 use tokio::sync::Mutex;
-use tokio_util::io::ReaderStream;
+use tokio_util::codec::{Decoder, FramedRead};
 
 pub use messages::*;
 
@@ -91,10 +92,9 @@ impl JsonStreamProtocol {
 
     /// Send a protocol message
     pub async fn send_message(&self, message: &ProtocolMessage) -> Result<(), ProtocolError> {
-        let json = serde_json::to_string(message)?;
+        let line = encode_line(message)?;
         let mut writer = self.writer.lock().await;
-        writer.write_all(json.as_bytes()).await?;
-        writer.write_all(b"\n").await?;
+        writer.write_all(&line).await?;
         writer.flush().await?;
         Ok(())
     }
@@ -157,27 +157,177 @@ impl ProtocolReader {
             return Err(ProtocolError::ConnectionClosed);
         }
 
-        let message: ProtocolMessage = serde_json::from_str(&line)
-            .map_err(|e| ProtocolError::InvalidMessage(format!("{}: '{}'", e, line)))?;
+        let message: ProtocolMessage = serde_json::from_str(&line).map_err(|e| {
+            ProtocolError::InvalidMessage(format!("{}: '{}'", e, error_preview(&line)))
+        })?;
 
         Ok(message)
     }
 
     /// Convert to a stream of messages
+    ///
+    /// Output is framed on newlines, so each item is exactly one message no
+    /// matter how the bytes were split across pipe reads. A line that is not
+    /// valid UTF-8 or JSON, or is longer than `MAX_LINE_LEN`, becomes a single
+    /// `Err` item and the stream carries on with the next line.
     pub fn into_stream(self) -> impl Stream<Item = Result<ProtocolMessage, ProtocolError>> {
-        ReaderStream::new(self.reader).then(|line_result| async move {
-            let bytes = line_result?;
-            let line = std::str::from_utf8(&bytes)
-                .map_err(|e| ProtocolError::InvalidMessage(format!("UTF-8 error: {}", e)))?;
-            let message: ProtocolMessage =
-                serde_json::from_str(line).map_err(|e| {
-                    ProtocolError::InvalidMessage(format!("{}: '{}'", e, line))
+        FramedRead::new(self.reader, LineFramer::new(MAX_LINE_LEN)).map(
+            |frame| -> Result<ProtocolMessage, ProtocolError> {
+                let line = match frame? {
+                    Frame::Line(line) => line,
+                    Frame::TooLong => {
+                        return Err(ProtocolError::InvalidMessage(format!(
+                            "line exceeds {} bytes",
+                            MAX_LINE_LEN
+                        )));
+                    }
+                };
+                let line = std::str::from_utf8(&line)
+                    .map_err(|e| ProtocolError::InvalidMessage(format!("UTF-8 error: {}", e)))?;
+                let message: ProtocolMessage = serde_json::from_str(line).map_err(|e| {
+                    ProtocolError::InvalidMessage(format!("{}: '{}'", e, error_preview(line)))
                 })?;
-            Ok(message)
-        })
+                Ok(message)
+            },
+        )
     }
 }
 
+/// Maximum length of a single protocol line read by `ProtocolReader::into_stream`
+const MAX_LINE_LEN: usize = 16 * 1024 * 1024;
+
+/// A newline-delimited frame read from an agent
+#[derive(Debug, PartialEq)]
+enum Frame {
+    /// A complete line, without its line ending
+    Line(BytesMut),
+    /// A line longer than the framer's limit, which was discarded
+    TooLong,
+}
+
+/// Newline framing for agent output
+///
+/// Unlike `LinesCodec`, bad input never fails the decoder, which would end the
+/// `FramedRead` stream: oversized lines come out as `Frame::TooLong` and UTF-8
+/// validation is left to the caller.
+#[derive(Debug)]
+struct LineFramer {
+    max_length: usize,
+    /// Offset up to which the buffer is known to contain no newline
+    next_index: usize,
+    /// Whether the rest of an oversized line is being skipped
+    discarding: bool,
+}
+
+impl LineFramer {
+    fn new(max_length: usize) -> Self {
+        Self {
+            max_length,
+            next_index: 0,
+            discarding: false,
+        }
+    }
+}
+
+impl Decoder for LineFramer {
+    type Item = Frame;
+    type Error = std::io::Error;
+
+    fn decode(&mut self, buf: &mut BytesMut) -> Result<Option<Frame>, std::io::Error> {
+        loop {
+            let newline = buf[self.next_index..]
+                .iter()
+                .position(|b| *b == b'\n')
+                .map(|offset| self.next_index + offset);
+
+            match newline {
+                Some(end) => {
+                    self.next_index = 0;
+
+                    if self.discarding {
+                        // End of an oversized line, resume with the next one
+                        buf.advance(end + 1);
+                        self.discarding = false;
+                        continue;
+                    }
+
+                    if end > self.max_length {
+                        buf.advance(end + 1);
+                        return Ok(Some(Frame::TooLong));
+                    }
+
+                    let mut line = buf.split_to(end + 1);
+                    line.truncate(end);
+                    if line.last() == Some(&b'\r') {
+                        line.truncate(end - 1);
+                    }
+                    return Ok(Some(Frame::Line(line)));
+                }
+                None if self.discarding => {
+                    buf.clear();
+                    self.next_index = 0;
+                    return Ok(None);
+                }
+                None if buf.len() > self.max_length => {
+                    // Report the line once, then skip the rest of it as it arrives
+                    buf.clear();
+                    self.next_index = 0;
+                    self.discarding = true;
+                    return Ok(Some(Frame::TooLong));
+                }
+                None => {
+                    self.next_index = buf.len();
+                    return Ok(None);
+                }
+            }
+        }
+    }
+
+    fn decode_eof(&mut self, buf: &mut BytesMut) -> Result<Option<Frame>, std::io::Error> {
+        if let Some(frame) = self.decode(buf)? {
+            return Ok(Some(frame));
+        }
+
+        // A final line without a trailing newline
+        self.next_index = 0;
+        if self.discarding || buf.is_empty() {
+            buf.clear();
+            self.discarding = false;
+            Ok(None)
+        } else {
+            Ok(Some(Frame::Line(buf.split())))
+        }
+    }
+}
+
+/// Serialize a message as a single newline-terminated NDJSON line
+///
+/// Encoding straight into a byte buffer with the delimiter appended lets the
+/// message go out in one write instead of two.
+fn encode_line(message: &ProtocolMessage) -> Result<Vec<u8>, ProtocolError> {
+    let mut line = serde_json::to_vec(message)?;
+    line.push(b'\n');
+    Ok(line)
+}
+
+/// Maximum number of bytes of an offending line included in an error message
+const ERROR_PREVIEW_LEN: usize = 256;
+
+/// Truncate a line for inclusion in an error message
+///
+/// Keeps a malformed multi-megabyte line from being copied into the error.
+fn error_preview(line: &str) -> &str {
+    if line.len() <= ERROR_PREVIEW_LEN {
+        return line;
+    }
+
+    let mut end = ERROR_PREVIEW_LEN;
+    while !line.is_char_boundary(end) {
+        end -= 1;
+    }
+    &line[..end]
+}
+
 /// Protocol writer for sending messages
 ///
 /// Writes messages to a stream with newline delimiters.
@@ -195,10 +345,9 @@ impl ProtocolWriter {
 
     /// Write a message to the stream
     pub async fn write_message(&self, message: &ProtocolMessage) -> Result<(), ProtocolError> {
-        let json = serde_json::to_string(message)?;
+        let line = encode_line(message)?;
         let mut writer = self.writer.lock().await;
-        writer.write_all(json.as_bytes()).await?;
-        writer.write_all(b"\n").await?;
+        writer.write_all(&line).await?;
         writer.flush().await?;
         Ok(())
     }
@@ -295,4 +444,100 @@ mod tests {
         let msg_with_newline = format!("{}\n", json);
         assert!(msg_with_newline.ends_with('\n'));
     }
+
+    #[test]
+    fn test_encode_line() {
+        let msg = ProtocolMessage::user("test".to_string());
+        let line = encode_line(&msg).unwrap();
+
+        assert_eq!(line.last(), Some(&b'\n'));
+        let parsed: ProtocolMessage = serde_json::from_slice(&line[..line.len() - 1]).unwrap();
+        match parsed {
+            ProtocolMessage::User { content } => assert_eq!(content, "test"),
+            _ => panic!("Expected user message"),
+        }
+    }
+
+    #[test]
+    fn test_error_preview_truncates_on_char_boundary() {
+        assert_eq!(error_preview("short"), "short");
+
+        // The leading ASCII byte puts the cut-off in the middle of a 'é'
+        let long = format!("a{}", "é".repeat(ERROR_PREVIEW_LEN));
+        let preview = error_preview(&long);
+        assert!(preview.len() <= ERROR_PREVIEW_LEN);
+        assert!(long.starts_with(preview));
+    }
+
+    #[test]
+    fn test_line_framer_skips_oversized_lines() {
+        let mut framer = LineFramer::new(8);
+        let mut buf = BytesMut::from(&b"0123456789\r\nok\r\n0123456789"[..]);
+
+        assert_eq!(framer.decode(&mut buf).unwrap(), Some(Frame::TooLong));
+        assert_eq!(
+            framer.decode(&mut buf).unwrap(),
+            Some(Frame::Line(BytesMut::from(&b"ok"[..])))
+        );
+
+        // An oversized line split across reads is reported once and skipped
+        assert_eq!(framer.decode(&mut buf).unwrap(), Some(Frame::TooLong));
+        buf.extend_from_slice(b"abc\nlast");
+        assert_eq!(framer.decode(&mut buf).unwrap(), None);
+        assert_eq!(
+            framer.decode_eof(&mut buf).unwrap(),
+            Some(Frame::Line(BytesMut::from(&b"last"[..])))
+        );
+        assert_eq!(framer.decode_eof(&mut buf).unwrap(), None);
+    }
+
+    #[cfg(unix)]
+    #[tokio::test]
+    async fn test_reader_stream_survives_invalid_utf8_line() {
+        let valid = serde_json::to_string(&ProtocolMessage::user("two".to_string())).unwrap();
+
+        // A line containing a lone 0xFF byte, then a valid message
+        let mut child = tokio::process::Command::new("printf")
+            .args(["\\377\n%s\n", &valid])
+            .stdout(std::process::Stdio::piped())
+            .spawn()
+            .unwrap();
+        let stdout = child.stdout.take().unwrap();
+
+        let messages: Vec<_> = ProtocolReader::new(stdout).into_stream().collect().await;
+        child.wait().await.unwrap();
+
+        assert_eq!(messages.len(), 2);
+        assert!(matches!(messages[0], Err(ProtocolError::InvalidMessage(_))));
+        match &messages[1] {
+            Ok(ProtocolMessage::User { content }) => assert_eq!(content, "two"),
+            other => panic!("Expected user message, got {:?}", other),
+        }
+    }
+
+    #[cfg(unix)]
+    #[tokio::test]
+    async fn test_reader_stream_splits_messages_per_line() {
+        let first = serde_json::to_string(&ProtocolMessage::user("one".to_string())).unwrap();
+        let second = serde_json::to_string(&ProtocolMessage::user("two".to_string())).unwrap();
+
+        // Both messages arrive in a single pipe write
+        let mut child = tokio::process::Command::new("printf")
+            .args(["%s\n%s\n", &first, &second])
+            .stdout(std::process::Stdio::piped())
+            .spawn()
+            .unwrap();
+        let stdout = child.stdout.take().unwrap();
+
+        let messages: Vec<_> = ProtocolReader::new(stdout).into_stream().collect().await;
+        child.wait().await.unwrap();
+
+        assert_eq!(messages.len(), 2);
+        for (message, expected) in messages.into_iter().zip(["one", "two"]) {
+            match message.unwrap() {
+                ProtocolMessage::User { content } => assert_eq!(content, expected),
+                _ => panic!("Expected user message"),
+            }
+        }
+    }
 }
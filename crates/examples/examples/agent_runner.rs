@@ -16,50 +16,53 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     // Create the shell agent
     let agent = ShellAgent::new();
 
-    // Example 1: Basic configuration
-    println!("=== Example 1: Basic Configuration ===");
     let runner = AgentRunner::new(agent);
 
-    let config = AgentConfig::new(PathBuf::from("."));
-    let result = runner.run("echo 'Hello from AgentRunner!'", config).await?;
+    // Examples 1-4 are independent, so run them concurrently on the same
+    // runner and report the results in order once they have all finished.
 
-    println!("Success: {}", result.success);
-    println!("Output: {}", result.output);
+    // Example 1: Basic configuration
+    let basic_config = AgentConfig::new(PathBuf::from("."));
 
     // Example 2: Configuration with environment variables
-    println!("\n=== Example 2: With Environment Variables ===");
-
-    let config = AgentConfig::new(PathBuf::from("."))
+    let env_config = AgentConfig::new(PathBuf::from("."))
         .add_env("MY_VAR", "my_value")
         .add_env("ANOTHER_VAR", "another_value");
 
-    let command = if cfg!(windows) {
+    let env_command = if cfg!(windows) {
         "echo %MY_VAR%"
     } else {
         "echo $MY_VAR"
     };
 
-    let result = runner.run(command, config).await?;
-    println!("Output: {}", result.output);
-
     // Example 3: Configuration with timeout
-    println!("\n=== Example 3: With Timeout ===");
-
-    let config = AgentConfig::new(PathBuf::from("."))
+    let timeout_config = AgentConfig::new(PathBuf::from("."))
         .with_timeout(Duration::from_secs(5));
 
-    let result = runner.run("echo 'With timeout'", config).await?;
-    println!("Success: {}", result.success);
-
     // Example 4: Error handling
-    println!("\n=== Example 4: Error Handling ===");
+    let failing_config = AgentConfig::new(PathBuf::from("."));
 
-    let config = AgentConfig::new(PathBuf::from("."));
-    let result = runner.run("false", config).await?; // Command that fails
+    let (basic, env, timeout, failing) = tokio::try_join!(
+        runner.run("echo 'Hello from AgentRunner!'", basic_config),
+        runner.run(env_command, env_config),
+        runner.run("echo 'With timeout'", timeout_config),
+        runner.run("false", failing_config), // Command that fails
+    )?;
 
+    println!("=== Example 1: Basic Configuration ===");
+    println!("Success: {}", basic.success);
+    println!("Output: {}", basic.output);
+
+    println!("\n=== Example 2: With Environment Variables ===");
+    println!("Output: {}", env.output);
+
+    println!("\n=== Example 3: With Timeout ===");
+    println!("Success: {}", timeout.success);
+
+    println!("\n=== Example 4: Error Handling ===");
     println!("Command failed (as expected)");
-    println!("Success: {}", result.success);
-    println!("Exit Result: {:?}", result.exit_result);
+    println!("Success: {}", failing.success);
+    println!("Exit Result: {:?}", failing.exit_result);
 
     // Example 5: Using workspace isolation
     println!("\n=== Example 5: Workspace Isolation ===");
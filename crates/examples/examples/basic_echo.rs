@@ -4,6 +4,7 @@
 
 use lite_agent_core::{AgentConfig, AgentRunner};
 use lite_agent_examples::EchoAgent;
+use std::io::{BufWriter, Write};
 use std::path::PathBuf;
 
 #[tokio::main]
@@ -28,9 +29,14 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     println!("Success: {}", result.success);
     println!("Exit Result: {:?}", result.exit_result);
     println!("\n=== Logs ===");
+    // Buffer the log dump so it is written in batches rather than one
+    // line-flushed write per entry.
+    let mut out = BufWriter::new(std::io::stdout().lock());
     for log in &result.logs {
-        println!("{:?}: {}", log.entry_type, log.content);
+        writeln!(out, "{:?}: {}", log.entry_type, log.content)?;
     }
+    out.flush()?;
+    drop(out);
 
     println!("\n=== Output ===");
     println!("{}", result.output);
@@ -9,6 +9,7 @@ use lite_agent_core::{
     AgentCapability, AgentConfig, AgentError, AgentExecutor, AgentRunner, AvailabilityStatus,
     EntryType, LogStore, NormalizedEntry, SpawnedAgent,
 };
+use std::io::{BufWriter, Write};
 use std::process::Stdio;
 use std::sync::Arc;
 use tokio::process::Command as TokioCommand;
@@ -137,9 +138,14 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     println!("\n=== Result ===");
     println!("Success: {}", result.success);
     println!("Logs:");
+    // Buffer the log dump so it is written in batches rather than one
+    // line-flushed write per entry.
+    let mut out = BufWriter::new(std::io::stdout().lock());
     for log in &result.logs {
-        println!("  - {:?}", log);
+        writeln!(out, "  - {:?}", log)?;
     }
+    out.flush()?;
+    drop(out);
 
     Ok(())
 }
@@ -7,19 +7,24 @@ tests and examples without needing to remember multiple cargo commands.
 """
 
 import argparse
-import subprocess
+import functools
+import os
+import shutil
 import sys
 from typing import List, Optional
 
 
 # Available examples in the project
-AVAILABLE_EXAMPLES = [
+AVAILABLE_EXAMPLES = frozenset({
     "agent_runner",
     "basic_echo",
     "basic_shell",
     "claude_code_cli",
     "custom_agent",
-]
+})
+
+# Display string for help and error messages
+_EXAMPLES_DISPLAY = ", ".join(sorted(AVAILABLE_EXAMPLES))
 
 # Binaries (use --bin instead of --example)
 BINARIES = {
@@ -41,27 +46,31 @@ def print_info(message: str) -> None:
     print(f"[lite-agent-cli] {message}")
 
 
+@functools.lru_cache(maxsize=1)
 def check_cargo_available() -> bool:
-    """Check if cargo is available in PATH."""
-    try:
-        result = subprocess.run(
-            ["cargo", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    """
+    Check if cargo is available in PATH.
+
+    The result is cached, so repeated in-process main() or dispatch() calls
+    look cargo up only once. Call check_cargo_available.cache_clear() to
+    probe again.
+    """
+    # A PATH lookup is enough here; spawning `cargo --version` costs a full
+    # process start on every CLI invocation.
+    return shutil.which("cargo") is not None
 
 
-def run_command(args: List[str], description: str) -> int:
+def run_command(args: List[str], description: str, exec_command: bool = False) -> int:
     """
     Run a command and stream its output.
 
     Args:
         args: Command and arguments to execute
         description: Human-readable description of what's being executed
+        exec_command: Replace the current process with the command on POSIX
+            systems instead of running it as a child. Only the script entry
+            point sets this; in that case this only returns if the command
+            could not be started.
 
     Returns:
         Exit code from the command
@@ -69,7 +78,19 @@ def run_command(args: List[str], description: str) -> int:
     print_info(f"Running: {description}")
     print_info(f"Executing: {' '.join(args)}\n")
 
+    # Flush our own output so it is not lost or reordered behind the command's
+    sys.stdout.flush()
+    sys.stderr.flush()
+
     try:
+        if exec_command and os.name == "posix":
+            # Nothing runs after the command, so replace this process with it
+            # instead of forking a child and waiting on it.
+            os.execvp(args[0], args)
+
+        # Imported lazily: the script entry point execs above and never needs it
+        import subprocess
+
         # Run the command and stream output directly to console
         result = subprocess.run(args, stdout=None, stderr=None)
         return result.returncode
@@ -84,7 +105,7 @@ def run_command(args: List[str], description: str) -> int:
         return 1
 
 
-def cmd_test(args: argparse.Namespace) -> int:
+def cmd_test(args: argparse.Namespace, exec_command: bool = False) -> int:
     """Run all unit tests using cargo test."""
     cargo_args = ["cargo", "test"]
 
@@ -96,21 +117,21 @@ def cmd_test(args: argparse.Namespace) -> int:
     if args.extra:
         cargo_args.extend(args.extra)
 
-    return run_command(cargo_args, "Unit tests")
+    return run_command(cargo_args, "Unit tests", exec_command)
 
 
-def cmd_sample(args: argparse.Namespace) -> int:
+def cmd_sample(args: argparse.Namespace, exec_command: bool = False) -> int:
     """Run a specific example using cargo run --example or --bin."""
     if not args.name:
         print_error("Sample name is required.")
-        print_info(f"Available samples: {', '.join(AVAILABLE_EXAMPLES)}")
+        print_info(f"Available samples: {_EXAMPLES_DISPLAY}")
         print_info("Usage: python lite_agent_cli.py sample <name>")
         return 1
 
     # Check if the example exists
     if args.name not in AVAILABLE_EXAMPLES:
         print_error(f"Sample '{args.name}' not found.")
-        print_info(f"Available samples: {', '.join(AVAILABLE_EXAMPLES)}")
+        print_info(f"Available samples: {_EXAMPLES_DISPLAY}")
         return 1
 
     # Use --bin for binaries, --example for regular examples
@@ -121,11 +142,12 @@ def cmd_sample(args: argparse.Namespace) -> int:
     if args.extra:
         cargo_args.extend(args.extra)
 
-    return run_command(cargo_args, f"Example: {args.name}")
+    return run_command(cargo_args, f"Example: {args.name}", exec_command)
 
 
-def main() -> int:
-    """Main entry point for the CLI."""
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the CLI. The parser is built once and reused."""
     parser = argparse.ArgumentParser(
         prog="lite_agent_cli.py",
         description="Unified CLI for lite-agent-lib development tasks",
@@ -137,7 +159,7 @@ Examples:
   python lite_agent_cli.py test --verbose    Run tests with verbose output
 
 Available samples:
-  """ + ", ".join(AVAILABLE_EXAMPLES)
+  """ + _EXAMPLES_DISPLAY
     )
 
     parser.add_argument(
@@ -184,13 +206,43 @@ Available samples:
         help="Extra arguments to pass to the example"
     )
 
-    # Parse arguments
-    try:
-        args = parser.parse_args()
-    except SystemExit as e:
-        # argparse calls sys.exit on error, convert to return code
-        return e.code if e.code is not None else 2
+    return parser
+
+
+def _parse_fast_path(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Recognize the most common invocations without building the parser.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+
+    Returns:
+        Parsed arguments for a bare `test` or `sample <name>` invocation,
+        or None if the full parser is needed
+    """
+    if argv == ["test"]:
+        return argparse.Namespace(verbose=False, command="test", extra=[])
+
+    if len(argv) == 2 and argv[0] == "sample" and argv[1] in AVAILABLE_EXAMPLES:
+        return argparse.Namespace(
+            verbose=False, command="sample", name=argv[1], extra=[]
+        )
+
+    return None
+
+
+def dispatch(args: argparse.Namespace, exec_command: bool = False) -> int:
+    """
+    Run the command selected by the parsed arguments.
 
+    Args:
+        args: Parsed command-line arguments
+        exec_command: Replace this process with cargo instead of waiting on
+            it (see run_command). Leave unset when calling from other code.
+
+    Returns:
+        Exit code for the CLI
+    """
     # Check if cargo is available
     if not check_cargo_available():
         print_error("Cargo is not installed or not in PATH.")
@@ -199,14 +251,44 @@ Available samples:
 
     # Dispatch to appropriate command handler
     if args.command == "test":
-        return cmd_test(args)
+        return cmd_test(args, exec_command)
     elif args.command == "sample":
-        return cmd_sample(args)
+        return cmd_sample(args, exec_command)
     else:
         # No command specified or invalid command
-        parser.print_help()
+        build_parser().print_help()
         return 1
 
 
+def main(argv: Optional[List[str]] = None, exec_command: bool = False) -> int:
+    """
+    Main entry point for the CLI.
+
+    Args:
+        argv: Command-line arguments, excluding the program name. Defaults
+            to sys.argv[1:]
+        exec_command: Replace this process with cargo instead of waiting on
+            it. Only the script entry point sets this, so in-process callers
+            always get an exit code back.
+
+    Returns:
+        Exit code for the CLI
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Skip argparse entirely for the common no-flag invocations
+    args = _parse_fast_path(argv)
+    if args is None:
+        # Parse arguments
+        try:
+            args = build_parser().parse_args(argv)
+        except SystemExit as e:
+            # argparse calls sys.exit on error, convert to return code
+            return e.code if e.code is not None else 2
+
+    return dispatch(args, exec_command)
+
+
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(exec_command=True))